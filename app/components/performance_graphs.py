@@ -67,6 +67,7 @@ class PerformanceGraphs(QWidget):
             ax = self.memory_figure.add_subplot(111)
             
             memory_usage = [d['percent'] for d in history_data]
+            timestamps = list(timestamps)
             
             # Ensure timestamps and memory_usage have the same length
             min_len = min(len(timestamps), len(memory_usage))
@@ -96,7 +97,7 @@ class PerformanceGraphs(QWidget):
             
             # Format x-axis
             ax.set_xticks(range(0, len(memory_usage), max(1, len(memory_usage) // 5)))
-            ax.set_xticklabels([t.strftime('%H:%M:%S') for t in timestamps[::max(1, len(memory_usage) // 5)]], rotation=45)
+            ax.set_xticklabels([datetime.fromtimestamp(t).strftime('%H:%M:%S') for t in timestamps[::max(1, len(memory_usage) // 5)]], rotation=45)
             
             self.memory_figure.tight_layout()
             self.memory_canvas.draw()
@@ -109,6 +110,7 @@ class PerformanceGraphs(QWidget):
             self.cpu_figure.clear()
             ax = self.cpu_figure.add_subplot(111)
             
+            cpu_history = list(cpu_history)
             x_range = range(len(cpu_history))
             
             # Create line plot with gradient
@@ -177,7 +179,7 @@ class PerformanceGraphs(QWidget):
             self.page_figure.clear()
             ax = self.page_figure.add_subplot(111)
             
-            page_faults = perf_metrics['page_faults']
+            page_faults = list(perf_metrics['page_faults'])
             x_range = range(len(page_faults))
             
             # Create bar plot with color gradient based on value
@@ -6,11 +6,11 @@ import os
 import platform
 import time
 import logging
-import threading
 import numpy as np
 import traceback
 import ctypes
-from datetime import datetime
+import functools
+from collections import deque
 import psutil
 
 print("Loading PyQt5 modules...")
@@ -19,27 +19,19 @@ try:
         QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
         QHBoxLayout, QPushButton, QLabel, QProgressBar, QGroupBox,
         QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
-        QSplitter, QFrame
+        QSplitter, QFrame, QSplashScreen
     )
-    from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QObject, QThread
-    from PyQt5.QtGui import QFont, QIcon, QColor
+    from PyQt5.QtCore import (
+        QTimer, Qt, pyqtSignal, QObject, QThread, QMutex, QWaitCondition, QEvent,
+        QRunnable, QThreadPool
+    )
+    from PyQt5.QtGui import QFont, QIcon, QColor, QPixmap
     
 except Exception as e:
     print(f"ERROR: Failed to import PyQt5 modules: {e}")
     print(f"Traceback: {traceback.format_exc()}")
     sys.exit(1)
 
-print("Loading application modules...")
-try:
-    from app.models import MemoryStats, CacheStats, PerformanceMetrics, MemoryOptimizer, CacheOptimizer
-    from app.components.memory_graph import MemoryGraph
-    from app.components.performance_graphs import PerformanceGraphs
-    print("Application modules loaded successfully")
-except Exception as e:
-    print(f"Error loading application modules: {e}")
-    print(f"Traceback: {traceback.format_exc()}")
-    sys.exit(1)
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +39,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reciprocal of one GiB, for byte to GB conversions
+_INV_GIB = 1.0 / (1024.0 ** 3)
+
+# Stats table rows: (label, stats key, bound format template, scale or None)
+_MEM_FMT = (
+    ("Total Memory", 'total', "{:.2f} GB".format, _INV_GIB),
+    ("Available Memory", 'available', "{:.2f} GB".format, _INV_GIB),
+    ("Used Memory", 'used', "{:.2f} GB".format, _INV_GIB),
+    ("Free Memory", 'free', "{:.2f} GB".format, _INV_GIB),
+    ("Memory Usage", 'percent', "{:.1f}%".format, None),
+    ("Swap Total", 'swap_total', "{:.2f} GB".format, _INV_GIB),
+    ("Swap Used", 'swap_used', "{:.2f} GB".format, _INV_GIB),
+    ("Swap Free", 'swap_free', "{:.2f} GB".format, _INV_GIB),
+    ("Swap Usage", 'swap_percent', "{:.1f}%".format, None),
+    ("Last Updated", 'timestamp', str, None),
+)
+_CACHE_FMT = (
+    ("Cache Hits", 'hits', str, None),
+    ("Cache Misses", 'misses', str, None),
+    ("Hit Ratio", 'hit_ratio', "{:.1f}%".format, 100),
+    ("Access Time", 'access_time', "{:.3f} ms".format, None),
+    ("Eviction Rate", 'eviction_rate', "{:.3f}".format, None),
+    ("Write Back Rate", 'write_back_rate', "{:.3f}".format, None),
+    ("Last Updated", 'timestamp', str, None),
+)
+
+
+_APP_MODULES_LOADED = False
+
+
+def _load_app_modules():
+    """Import the application modules.
+
+    Deferred until a QApplication exists so the splash screen can be painted
+    before the heavy model and matplotlib imports run.
+    """
+    global MemoryStats, CacheStats, PerformanceMetrics, MemoryOptimizer, CacheOptimizer
+    global MemoryGraph, PerformanceGraphs, _APP_MODULES_LOADED
+    if _APP_MODULES_LOADED:
+        return
+    print("Loading application modules...")
+    from app.models import MemoryStats, CacheStats, PerformanceMetrics, MemoryOptimizer, CacheOptimizer
+    from app.components.memory_graph import MemoryGraph
+    from app.components.performance_graphs import PerformanceGraphs
+    _APP_MODULES_LOADED = True
+    print("Application modules loaded successfully")
+
+
+def _finish_startup(app, splash):
+    """Load the application modules and replace the splash screen with the main window"""
+    global window
+    try:
+        _load_app_modules()
+    except Exception as e:
+        logger.error(f"Error loading application modules: {e}")
+        print(f"Error loading application modules: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        splash.close()
+        app.exit(1)
+        return
+    
+    try:
+        print("Creating main window...")
+        window = MemoryMonitorApp()
+        print("Showing main window...")
+        window.show()
+        splash.finish(window)
+    except Exception as e:
+        logger.error(f"Error creating main window: {e}")
+        print(f"Error creating main window: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        splash.close()
+        app.exit(1)
+        return
+    
+    # Shown only once the splash is gone so the modal can't end up behind it
+    window.warn_if_not_admin()
+
+
+@functools.lru_cache(maxsize=1)
+def _check_admin():
+    """Check once whether the application is running with admin privileges"""
+    try:
+        return ctypes.windll.shell32.IsUserAnAdmin() != 0
+    except Exception as e:
+        logger.error(f"Error checking admin privileges: {e}")
+        return False
+
 
 class MatplotlibCanvas:
     """Dummy matplotlib canvas class that does nothing"""
@@ -70,16 +150,15 @@ class WorkerSignals(QObject):
     progress = pyqtSignal(dict)  # Signal for progress updates
 
 
-class OptimizeWorker(QThread):
+class OptimizeWorker(QRunnable):
     '''
-    Worker thread for running optimization tasks
+    Thread pool job for running optimization tasks
     '''
-    def __init__(self, optimize_type):
+    def __init__(self, optimize_type, signals):
         super().__init__()
         self.optimize_type = optimize_type
-        self.signals = WorkerSignals()
-        # Connect the progress signal from signals object
-        self.progress = self.signals.progress
+        # Signals are owned by the caller and connected once, not per job
+        self.signals = signals
     
     def run(self):
         try:
@@ -123,28 +202,80 @@ class OptimizeWorker(QThread):
             self.signals.error.emit(str(e))
 
 
+class StatsSampler(QThread):
+    '''
+    Background thread that samples system stats and pushes them to the UI
+    '''
+    stats_ready = pyqtSignal(dict, dict, dict, float)
+
+    def __init__(self, interval_ms=1000):
+        super().__init__()
+        self.interval_ms = interval_ms
+        self._running = True
+        self._mutex = QMutex()
+        self._wakeup = QWaitCondition()
+
+    def set_interval(self, interval_ms):
+        """Change the sampling interval; a shorter interval takes effect immediately"""
+        self._mutex.lock()
+        if interval_ms < self.interval_ms:
+            # Don't sit out the rest of a longer idle wait
+            self._wakeup.wakeAll()
+        self.interval_ms = interval_ms
+        self._mutex.unlock()
+
+    def request_update(self):
+        """Wake the sampler so it takes a sample immediately"""
+        self._mutex.lock()
+        self._wakeup.wakeAll()
+        self._mutex.unlock()
+
+    def stop(self):
+        """Stop sampling and wait for the thread to exit"""
+        self._mutex.lock()
+        self._running = False
+        self._wakeup.wakeAll()
+        self._mutex.unlock()
+        self.wait()
+
+    def run(self):
+        while self._running:
+            try:
+                memory_dict = MemoryStats.get_current().to_dict()
+                cache_dict = CacheStats.get_current().to_dict()
+                perf_dict = PerformanceMetrics.get_current().to_dict()
+                cpu_percent = float(psutil.cpu_percent())
+                self.stats_ready.emit(memory_dict, cache_dict, perf_dict, cpu_percent)
+            except Exception as e:
+                logger.error(f"Error sampling stats: {str(e)}")
+
+            self._mutex.lock()
+            if self._running:
+                self._wakeup.wait(self._mutex, self.interval_ms)
+            self._mutex.unlock()
+
+
 class MemoryMonitorApp(QMainWindow):
+    # Sampling intervals (ms) for the visible and minimized/idle states
+    ACTIVE_INTERVAL_MS = 1000
+    IDLE_INTERVAL_MS = 5000
+    # Number of samples kept for the history graphs (1 minute at 1 second intervals)
+    MAX_HISTORY = 60
+
     def __init__(self):
         super().__init__()
+        _load_app_modules()
         self.setWindowIcon(QIcon("icon.ico"))
         
         # Initialize data storage
-        self.memory_history = []
-        self.cache_history = []
-        self.timestamps = []
-        self.performance_metrics = {
-            'response_times': [],
-            'throughput': [],
-            'page_faults': [],
-            'swap_usage': []
-        }
+        self.reset_histories()
         self.optimization_history = {
             'memory': {'before': None, 'after': None, 'details': []},
             'cache': {'before': None, 'after': None, 'details': []}
         }
         
-        # Initialize CPU history
-        self.cpu_history = []
+        # Last text/value written to each live widget, keyed by id()
+        self._last_written = {}
         
         # Initialize optimization flags
         self.optimization_in_progress = False
@@ -158,6 +289,9 @@ class MemoryMonitorApp(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
+        # Create the status bar up front so result messages don't shift the layout
+        self.statusBar()
+        
         # Create tab widget
         self.tabs = QTabWidget()
         self.main_layout.addWidget(self.tabs)
@@ -179,26 +313,29 @@ class MemoryMonitorApp(QMainWindow):
         self.setup_cache_tab()
         self.setup_optimization_tab()
         
-        # Setup update timer (1 second interval)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(1000)  # 1000ms = 1s
-        
-        # Check for admin privileges
-        is_admin = False
-        try:
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except Exception as e:
-            logger.error(f"Error checking admin privileges: {e}")
-        
-        if not is_admin:
-            QMessageBox.warning(
-                self, 
-                "Limited Functionality", 
-                "This application is running without administrator privileges.\n\n"
-                "Some optimization features will be limited. For full functionality, "
-                "please restart the application with administrator rights."
-            )
+        # Optimization jobs run on the shared thread pool; their signals are
+        # created and connected once here rather than per click
+        self.pool = QThreadPool.globalInstance()
+        self.memory_signals = WorkerSignals()
+        self.memory_signals.finished.connect(self.on_memory_optimization_finished)
+        self.memory_signals.error.connect(self.on_optimization_error)
+        self.memory_signals.progress.connect(self.on_optimization_progress)
+        self.cache_signals = WorkerSignals()
+        self.cache_signals.finished.connect(self.on_cache_optimization_finished)
+        self.cache_signals.error.connect(self.on_optimization_error)
+        self.cache_signals.progress.connect(self.on_optimization_progress)
+        
+        # Group the optimize buttons so their state is toggled together
+        self._memory_btns = [
+            self.memory_optimize_btn,
+            self.memory_optimize_detail_btn,
+            self.memory_optimize_opt_btn
+        ]
+        self._cache_btns = [
+            self.cache_optimize_btn,
+            self.cache_optimize_detail_btn,
+            self.cache_optimize_opt_btn
+        ]
         
         # Create memory graph widget
         self.memory_graph = MemoryGraph(self)
@@ -211,8 +348,94 @@ class MemoryMonitorApp(QMainWindow):
         dashboard_layout = self.dashboard_tab.layout()
         dashboard_layout.addWidget(self.performance_graphs)
         
-        # Initial update
-        self.update_stats()
+        # Start background sampler; it pushes a first sample immediately
+        self.stats_sampler = StatsSampler(self.ACTIVE_INTERVAL_MS)
+        self.stats_sampler.stats_ready.connect(self.update_stats)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.stats_sampler.start()
+    
+    def warn_if_not_admin(self):
+        """Tell the user optimizations are limited without admin privileges"""
+        if not _check_admin():
+            QMessageBox.warning(
+                self, 
+                "Limited Functionality", 
+                "This application is running without administrator privileges.\n\n"
+                "Some optimization features will be limited. For full functionality, "
+                "please restart the application with administrator rights."
+            )
+    
+    def reset_histories(self):
+        """Create empty fixed-size history buffers"""
+        self.memory_history = deque(maxlen=self.MAX_HISTORY)
+        self.cache_history = deque(maxlen=self.MAX_HISTORY)
+        self.timestamps = deque(maxlen=self.MAX_HISTORY)
+        self.cpu_history = deque(maxlen=self.MAX_HISTORY)
+        self.performance_metrics = {
+            'response_times': deque(maxlen=self.MAX_HISTORY),
+            'throughput': deque(maxlen=self.MAX_HISTORY),
+            'page_faults': deque(maxlen=self.MAX_HISTORY),
+            'swap_usage': deque(maxlen=self.MAX_HISTORY)
+        }
+    
+    def _monitoring_visible(self):
+        """Whether a tab showing live stats is visible in a non-minimized window"""
+        if self.windowState() & Qt.WindowMinimized:
+            return False
+        return self.tabs.currentWidget() in (self.dashboard_tab, self.memory_tab, self.cache_tab)
+    
+    def _update_sampling_interval(self):
+        if self._monitoring_visible():
+            self.stats_sampler.set_interval(self.ACTIVE_INTERVAL_MS)
+        else:
+            self.stats_sampler.set_interval(self.IDLE_INTERVAL_MS)
+    
+    def _on_tab_changed(self, index):
+        self._update_sampling_interval()
+        # Catch the newly visible tab up with the latest sample
+        try:
+            self.update_visible_tab()
+        except Exception as e:
+            logger.error(f"Error refreshing tab: {str(e)}")
+    
+    def update_visible_tab(self):
+        """Refresh the widgets of the current tab from the latest sample"""
+        if self.windowState() & Qt.WindowMinimized:
+            return
+        if not self.memory_history or not self.cache_history:
+            return
+        memory_dict = self.memory_history[-1]
+        cache_dict = self.cache_history[-1]
+        
+        current_tab = self.tabs.currentWidget()
+        if current_tab is self.dashboard_tab:
+            self.update_dashboard_ui(memory_dict, cache_dict)
+            self.performance_graphs.update_all_graphs(
+                self.memory_history,
+                self.cpu_history,
+                self.cache_history,
+                self.performance_metrics,
+                self.timestamps
+            )
+        elif current_tab is self.memory_tab:
+            self.update_memory_tab(memory_dict)
+        elif current_tab is self.cache_tab:
+            self.update_cache_tab(cache_dict)
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange and hasattr(self, 'stats_sampler'):
+            self._update_sampling_interval()
+            # Catch the visible tab up once the window is restored
+            if event.oldState() & Qt.WindowMinimized and not self.windowState() & Qt.WindowMinimized:
+                try:
+                    self.update_visible_tab()
+                except Exception as e:
+                    logger.error(f"Error refreshing tab: {str(e)}")
+        super().changeEvent(event)
+    
+    def closeEvent(self, event):
+        self.stats_sampler.stop()
+        super().closeEvent(event)
     
     def setup_dashboard_tab(self):
         layout = QVBoxLayout(self.dashboard_tab)
@@ -295,7 +518,13 @@ class MemoryMonitorApp(QMainWindow):
         self.memory_table.setColumnCount(2)
         self.memory_table.setHorizontalHeaderLabels(["Metric", "Value"])
         self.memory_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.memory_table.setRowCount(10)
+        self.memory_table.setRowCount(len(_MEM_FMT))
+        
+        # Create the cells once; updates only change the value text
+        self._memory_cells = [[QTableWidgetItem(row[0]), QTableWidgetItem()] for row in _MEM_FMT]
+        for row, cells in enumerate(self._memory_cells):
+            for col, cell in enumerate(cells):
+                self.memory_table.setItem(row, col, cell)
         
         # Memory optimization button
         self.memory_optimize_detail_btn = QPushButton("Optimize Memory")
@@ -313,7 +542,13 @@ class MemoryMonitorApp(QMainWindow):
         self.cache_table.setColumnCount(2)
         self.cache_table.setHorizontalHeaderLabels(["Metric", "Value"])
         self.cache_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.cache_table.setRowCount(7)
+        self.cache_table.setRowCount(len(_CACHE_FMT))
+        
+        # Create the cells once; updates only change the value text
+        self._cache_cells = [[QTableWidgetItem(row[0]), QTableWidgetItem()] for row in _CACHE_FMT]
+        for row, cells in enumerate(self._cache_cells):
+            for col, cell in enumerate(cells):
+                self.cache_table.setItem(row, col, cell)
         
         # Cache optimization button
         self.cache_optimize_detail_btn = QPushButton("Optimize Cache")
@@ -360,24 +595,14 @@ class MemoryMonitorApp(QMainWindow):
         layout.addWidget(cache_opt_group)
         layout.addLayout(button_layout)
     
-    def update_stats(self):
+    def update_stats(self, memory_dict, cache_dict, perf_dict, cpu_percent):
+        """Handle a new sample pushed by the stats sampler"""
         try:
-            # Get current stats
-            memory_stats = MemoryStats.get_current()
-            cache_stats = CacheStats.get_current()
-            perf_metrics = PerformanceMetrics.get_current()
-            
-            # Get CPU usage
-            cpu_percent = psutil.cpu_percent()
             self.cpu_history.append(cpu_percent)
             
-            # Convert to dictionaries
-            memory_dict = memory_stats.to_dict()
-            cache_dict = cache_stats.to_dict()
-            perf_dict = perf_metrics.to_dict()
-            
-            # Store in history
-            current_time = datetime.now()
+            # Store in history; timestamps are plain epoch floats and only the
+            # few plotted ticks are formatted
+            current_time = time.time()
             self.memory_history.append(memory_dict)
             self.cache_history.append(cache_dict)
             self.timestamps.append(current_time)
@@ -387,53 +612,22 @@ class MemoryMonitorApp(QMainWindow):
             self.performance_metrics['page_faults'].append(perf_dict['page_faults'])
             self.performance_metrics['swap_usage'].append(perf_dict['swap_rate'])
             
-            # Ensure all arrays have the same length
-            min_length = min(
-                len(self.memory_history),
-                len(self.cache_history),
-                len(self.timestamps),
-                len(self.cpu_history),
-                len(self.performance_metrics['response_times']),
-                len(self.performance_metrics['throughput']),
-                len(self.performance_metrics['page_faults']),
-                len(self.performance_metrics['swap_usage'])
-            )
-            
-            # Trim all arrays to the same length
-            self.memory_history = self.memory_history[-min_length:]
-            self.cache_history = self.cache_history[-min_length:]
-            self.timestamps = self.timestamps[-min_length:]
-            self.cpu_history = self.cpu_history[-min_length:]
-            self.performance_metrics['response_times'] = self.performance_metrics['response_times'][-min_length:]
-            self.performance_metrics['throughput'] = self.performance_metrics['throughput'][-min_length:]
-            self.performance_metrics['page_faults'] = self.performance_metrics['page_faults'][-min_length:]
-            self.performance_metrics['swap_usage'] = self.performance_metrics['swap_usage'][-min_length:]
-            
-            # Limit history length to prevent using too much memory
-            max_history = 60  # 1 minute at 1 second intervals
-            if min_length > max_history:
-                self.memory_history = self.memory_history[-max_history:]
-                self.cache_history = self.cache_history[-max_history:]
-                self.timestamps = self.timestamps[-max_history:]
-                self.cpu_history = self.cpu_history[-max_history:]
-                self.performance_metrics['response_times'] = self.performance_metrics['response_times'][-max_history:]
-                self.performance_metrics['throughput'] = self.performance_metrics['throughput'][-max_history:]
-                self.performance_metrics['page_faults'] = self.performance_metrics['page_faults'][-max_history:]
-                self.performance_metrics['swap_usage'] = self.performance_metrics['swap_usage'][-max_history:]
-            
-            # Update all UI components
-            self.update_dashboard_ui(memory_dict, cache_dict)
-            self.update_memory_tab(memory_dict)
-            self.update_cache_tab(cache_dict)
-            
-            # Update performance graphs
-            self.performance_graphs.update_all_graphs(
+            # Ensure all histories have the same length; progress updates can
+            # push extra entries, so drop the oldest ones from longer buffers
+            histories = [
                 self.memory_history,
-                self.cpu_history,
                 self.cache_history,
-                self.performance_metrics,
-                self.timestamps
-            )
+                self.timestamps,
+                self.cpu_history,
+                *self.performance_metrics.values()
+            ]
+            min_length = min(len(history) for history in histories)
+            for history in histories:
+                while len(history) > min_length:
+                    history.popleft()
+            
+            # Only refresh the tab the user is looking at
+            self.update_visible_tab()
             
         except Exception as e:
             logger.error(f"Error updating stats: {str(e)}")
@@ -441,86 +635,79 @@ class MemoryMonitorApp(QMainWindow):
             
             # Try to recover from error by resetting histories
             try:
-                self.memory_history = []
-                self.cache_history = []
-                self.timestamps = []
-                self.cpu_history = []
-                self.performance_metrics = {
-                    'response_times': [],
-                    'throughput': [],
-                    'page_faults': [],
-                    'swap_usage': []
-                }
+                self.reset_histories()
             except Exception as reset_error:
                 logger.error(f"Error resetting histories: {str(reset_error)}")
     
     def update_dashboard_ui(self, memory_dict, cache_dict):
         # Update memory stats
         memory_percent = memory_dict['percent']
-        self.memory_usage_label.setText(f"Memory Usage: {memory_percent:.1f}%")
-        self.memory_usage_bar.setValue(int(memory_percent))
+        self._set_text(self.memory_usage_label, f"Memory Usage: {memory_percent:.1f}%")
+        self._set_value(self.memory_usage_bar, int(memory_percent))
         
         # Update memory details
-        total_gb = memory_dict['total'] / (1024**3)
-        used_gb = memory_dict['used'] / (1024**3)
-        free_gb = memory_dict['free'] / (1024**3)
+        total_gb = memory_dict['total'] * _INV_GIB
+        used_gb = memory_dict['used'] * _INV_GIB
+        free_gb = memory_dict['free'] * _INV_GIB
         
-        self.memory_total_label.setText(f"Total: {total_gb:.1f} GB")
-        self.memory_used_label.setText(f"Used: {used_gb:.1f} GB")
-        self.memory_free_label.setText(f"Free: {free_gb:.1f} GB")
+        self._set_text(self.memory_total_label, f"Total: {total_gb:.1f} GB")
+        self._set_text(self.memory_used_label, f"Used: {used_gb:.1f} GB")
+        self._set_text(self.memory_free_label, f"Free: {free_gb:.1f} GB")
         
         # Update cache stats
         hit_ratio = cache_dict['hit_ratio'] * 100
-        self.cache_hit_ratio_label.setText(f"Hit Ratio: {hit_ratio:.1f}%")
-        self.cache_hit_ratio_bar.setValue(int(hit_ratio))
+        self._set_text(self.cache_hit_ratio_label, f"Hit Ratio: {hit_ratio:.1f}%")
+        self._set_value(self.cache_hit_ratio_bar, int(hit_ratio))
         
         # Update cache details
-        self.cache_hits_label.setText(f"Hits: {cache_dict['hits']}")
-        self.cache_misses_label.setText(f"Misses: {cache_dict['misses']}")
-        self.cache_access_time_label.setText(f"Access Time: {cache_dict['access_time']:.3f} ms")
+        self._set_text(self.cache_hits_label, f"Hits: {cache_dict['hits']}")
+        self._set_text(self.cache_misses_label, f"Misses: {cache_dict['misses']}")
+        self._set_text(self.cache_access_time_label, f"Access Time: {cache_dict['access_time']:.3f} ms")
+    
+    def _set_text(self, widget, text):
+        """Set widget text only when it differs from the last value written"""
+        if self._last_written.get(id(widget)) != text:
+            widget.setText(text)
+            self._last_written[id(widget)] = text
+    
+    def _set_value(self, bar, value):
+        """Set progress bar value only when it differs from the last value written"""
+        if self._last_written.get(id(bar)) != value:
+            bar.setValue(value)
+            self._last_written[id(bar)] = value
     
     def update_memory_tab(self, memory_dict):
         # Update memory table
-        total_gb = memory_dict['total'] / (1024**3)
-        available_gb = memory_dict['available'] / (1024**3)
-        used_gb = memory_dict['used'] / (1024**3)
-        free_gb = memory_dict['free'] / (1024**3)
-        swap_total_gb = memory_dict['swap_total'] / (1024**3)
-        swap_used_gb = memory_dict['swap_used'] / (1024**3)
-        swap_free_gb = memory_dict['swap_free'] / (1024**3)
-        
-        memory_items = [
-            ("Total Memory", f"{total_gb:.2f} GB"),
-            ("Available Memory", f"{available_gb:.2f} GB"),
-            ("Used Memory", f"{used_gb:.2f} GB"),
-            ("Free Memory", f"{free_gb:.2f} GB"),
-            ("Memory Usage", f"{memory_dict['percent']:.1f}%"),
-            ("Swap Total", f"{swap_total_gb:.2f} GB"),
-            ("Swap Used", f"{swap_used_gb:.2f} GB"),
-            ("Swap Free", f"{swap_free_gb:.2f} GB"),
-            ("Swap Usage", f"{memory_dict['swap_percent']:.1f}%"),
-            ("Last Updated", memory_dict['timestamp'])
-        ]
-        
-        for i, (key, value) in enumerate(memory_items):
-            self.memory_table.setItem(i, 0, QTableWidgetItem(key))
-            self.memory_table.setItem(i, 1, QTableWidgetItem(value))
+        self._update_table(self.memory_table, self._memory_cells, self._format_rows(_MEM_FMT, memory_dict))
     
     def update_cache_tab(self, cache_dict):
         # Update cache table
-        cache_items = [
-            ("Cache Hits", str(cache_dict['hits'])),
-            ("Cache Misses", str(cache_dict['misses'])),
-            ("Hit Ratio", f"{cache_dict['hit_ratio']*100:.1f}%"),
-            ("Access Time", f"{cache_dict['access_time']:.3f} ms"),
-            ("Eviction Rate", f"{cache_dict['eviction_rate']:.3f}"),
-            ("Write Back Rate", f"{cache_dict['write_back_rate']:.3f}"),
-            ("Last Updated", cache_dict['timestamp'])
+        self._update_table(self.cache_table, self._cache_cells, self._format_rows(_CACHE_FMT, cache_dict))
+    
+    @staticmethod
+    def _format_rows(rows, stats_dict):
+        """Format the value column of a stats table from its row templates"""
+        return [
+            fmt(stats_dict[key] * scale) if scale is not None else fmt(stats_dict[key])
+            for _, key, fmt, scale in rows
         ]
-        
-        for i, (key, value) in enumerate(cache_items):
-            self.cache_table.setItem(i, 0, QTableWidgetItem(key))
-            self.cache_table.setItem(i, 1, QTableWidgetItem(value))
+    
+    def _update_table(self, table, cells, values):
+        """Write values into pre-created table cells in one repaint"""
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for (_, value_cell), value in zip(cells, values):
+                self._set_text(value_cell, value)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+    
+    def _set_optimize_buttons_state(self, buttons, enabled, text):
+        """Enable/disable a group of optimize buttons and set their label"""
+        for button in buttons:
+            button.setEnabled(enabled)
+            button.setText(text)
     
     def optimize_memory(self):
         try:
@@ -530,24 +717,11 @@ class MemoryMonitorApp(QMainWindow):
             self.optimization_in_progress = True
             
             # Disable all optimize buttons while running
-            self.memory_optimize_btn.setEnabled(False)
-            self.memory_optimize_detail_btn.setEnabled(False)
-            self.memory_optimize_opt_btn.setEnabled(False)
-            self.memory_optimize_btn.setText("Optimizing...")
-            self.memory_optimize_detail_btn.setText("Optimizing...")
-            self.memory_optimize_opt_btn.setText("Optimizing...")
+            self._set_optimize_buttons_state(self._memory_btns, False, "Optimizing...")
             self.status_label.setText("Optimizing memory...")
             
-            # Create worker thread
-            self.memory_worker = OptimizeWorker('memory')
-            
-            # Connect signals
-            self.memory_worker.signals.finished.connect(self.on_memory_optimization_finished)
-            self.memory_worker.signals.error.connect(self.on_optimization_error)
-            self.memory_worker.signals.progress.connect(self.on_optimization_progress)
-            
-            # Start worker
-            self.memory_worker.start()
+            # Queue the job on the thread pool
+            self.pool.start(OptimizeWorker('memory', self.memory_signals))
             
         except Exception as e:
             logger.error(f"Error starting memory optimization: {str(e)}")
@@ -561,24 +735,11 @@ class MemoryMonitorApp(QMainWindow):
             self.optimization_in_progress = True
             
             # Disable all optimize buttons while running
-            self.cache_optimize_btn.setEnabled(False)
-            self.cache_optimize_detail_btn.setEnabled(False)
-            self.cache_optimize_opt_btn.setEnabled(False)
-            self.cache_optimize_btn.setText("Optimizing...")
-            self.cache_optimize_detail_btn.setText("Optimizing...")
-            self.cache_optimize_opt_btn.setText("Optimizing...")
+            self._set_optimize_buttons_state(self._cache_btns, False, "Optimizing...")
             self.status_label.setText("Optimizing cache...")
             
-            # Create worker thread
-            self.cache_worker = OptimizeWorker('cache')
-            
-            # Connect signals
-            self.cache_worker.signals.finished.connect(self.on_cache_optimization_finished)
-            self.cache_worker.signals.error.connect(self.on_optimization_error)
-            self.cache_worker.signals.progress.connect(self.on_optimization_progress)
-            
-            # Start worker
-            self.cache_worker.start()
+            # Queue the job on the thread pool
+            self.pool.start(OptimizeWorker('cache', self.cache_signals))
             
         except Exception as e:
             logger.error(f"Error starting cache optimization: {str(e)}")
@@ -590,26 +751,31 @@ class MemoryMonitorApp(QMainWindow):
             # Update graphs based on progress
             if progress_data['type'] == 'memory':
                 self.memory_history.append(progress_data['stats'])
-                self.timestamps.append(datetime.now())
+                self.timestamps.append(time.time())
             elif progress_data['type'] == 'cache':
                 self.cache_history.append(progress_data['stats'])
-                self.timestamps.append(datetime.now())
+                self.timestamps.append(time.time())
             
-            # Update UI
-            self.update_stats()
+            # Ask the sampler for a fresh sample
+            self.stats_sampler.request_update()
             
         except Exception as e:
             logger.error(f"Error handling optimization progress: {str(e)}")
     
+    def show_status_message(self, message, timeout=5000):
+        """Show a transient, non-blocking message in the status bar"""
+        self.statusBar().showMessage(message, timeout)
+    
+    def show_optimization_warning(self, message):
+        """Report a failed optimization in the status bar and a deferred dialog"""
+        self.show_status_message(message)
+        # Defer the modal dialog so the current handler and stats tick finish first
+        QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Optimization Warning", message))
+    
     def on_memory_optimization_finished(self, success, message, before_stats, after_stats):
         try:
             # Re-enable all optimize buttons
-            self.memory_optimize_btn.setEnabled(True)
-            self.memory_optimize_detail_btn.setEnabled(True)
-            self.memory_optimize_opt_btn.setEnabled(True)
-            self.memory_optimize_btn.setText("Optimize Memory")
-            self.memory_optimize_detail_btn.setText("Optimize Memory")
-            self.memory_optimize_opt_btn.setText("Optimize Memory")
+            self._set_optimize_buttons_state(self._memory_btns, True, "Optimize Memory")
             self.status_label.setText("Memory optimization complete")
             
             # Update the graph
@@ -621,24 +787,17 @@ class MemoryMonitorApp(QMainWindow):
                 if improvement > 0.5:
                     concise_msg = f"Memory optimized: {improvement:.1f}% improvement"
                 elif improvement > 0:
-                    concise_msg = f"Memory slightly optimized: {improvement:.1f}% improvement\nSmall improvements are normal when system is already running efficiently"
+                    concise_msg = f"Memory slightly optimized: {improvement:.1f}% improvement (system already running efficiently)"
                 else:
-                    concise_msg = "System memory is running efficiently\nNo significant optimization needed"
+                    concise_msg = "System memory is running efficiently - no significant optimization needed"
                 
                 # Add temp files info
                 if any("temp files" in str(detail).lower() for detail in MemoryOptimizer.last_optimization_details):
-                    concise_msg += "\nTemp files cleaned"
-                    
-                # Add explanation for negative or small improvements
-                if improvement <= 0.5:
-                    concise_msg += "\n\nNote: Small or negative changes can occur due to:"
-                    concise_msg += "\n• Active system processes"
-                    concise_msg += "\n• Background applications"
-                    concise_msg += "\n• System already running optimally"
+                    concise_msg += " - Temp files cleaned"
                 
-                QMessageBox.information(self, "Optimization Complete", concise_msg)
+                self.show_status_message(concise_msg)
             else:
-                QMessageBox.warning(self, "Optimization Warning", "Memory optimization completed with some issues")
+                self.show_optimization_warning("Memory optimization completed with some issues")
             
             # Store optimization history
             self.optimization_history['memory']['before'] = before_stats
@@ -657,22 +816,17 @@ class MemoryMonitorApp(QMainWindow):
     def on_cache_optimization_finished(self, success, message, before_stats, after_stats):
         try:
             # Re-enable all optimize buttons
-            self.cache_optimize_btn.setEnabled(True)
-            self.cache_optimize_detail_btn.setEnabled(True)
-            self.cache_optimize_opt_btn.setEnabled(True)
-            self.cache_optimize_btn.setText("Optimize Cache")
-            self.cache_optimize_detail_btn.setText("Optimize Cache")
-            self.cache_optimize_opt_btn.setText("Optimize Cache")
+            self._set_optimize_buttons_state(self._cache_btns, True, "Optimize Cache")
             self.status_label.setText("Cache optimization complete")
             
             # Create concise message
             if success:
                 concise_msg = "Cache optimized successfully"
                 if any("temp files" in str(detail).lower() for detail in CacheOptimizer.last_optimization_details):
-                    concise_msg += "\nTemp files cleaned"
-                QMessageBox.information(self, "Optimization Complete", concise_msg)
+                    concise_msg += " - Temp files cleaned"
+                self.show_status_message(concise_msg)
             else:
-                QMessageBox.warning(self, "Optimization Warning", "Cache optimization completed with some issues")
+                self.show_optimization_warning("Cache optimization completed with some issues")
             
             # Store optimization history
             self.optimization_history['cache']['before'] = before_stats
@@ -691,19 +845,8 @@ class MemoryMonitorApp(QMainWindow):
     def on_optimization_error(self, error_message):
         try:
             # Re-enable all optimize buttons
-            self.memory_optimize_btn.setEnabled(True)
-            self.memory_optimize_detail_btn.setEnabled(True)
-            self.memory_optimize_opt_btn.setEnabled(True)
-            self.cache_optimize_btn.setEnabled(True)
-            self.cache_optimize_detail_btn.setEnabled(True)
-            self.cache_optimize_opt_btn.setEnabled(True)
-            
-            self.memory_optimize_btn.setText("Optimize Memory")
-            self.memory_optimize_detail_btn.setText("Optimize Memory")
-            self.memory_optimize_opt_btn.setText("Optimize Memory")
-            self.cache_optimize_btn.setText("Optimize Cache")
-            self.cache_optimize_detail_btn.setText("Optimize Cache")
-            self.cache_optimize_opt_btn.setText("Optimize Cache")
+            self._set_optimize_buttons_state(self._memory_btns, True, "Optimize Memory")
+            self._set_optimize_buttons_state(self._cache_btns, True, "Optimize Cache")
             
             self.status_label.setText("Optimization error")
             QMessageBox.critical(self, "Error", f"Optimization failed: {error_message}")
@@ -801,13 +944,7 @@ if __name__ == "__main__":
     try:
         print("Starting the application...")
         # Check for admin privileges
-        is_admin = False
-        try:
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except Exception as e:
-            logger.error(f"Error checking admin privileges: {e}")
-        
-        if not is_admin:
+        if not _check_admin():
             logger.warning("Application started without administrator privileges")
         else:
             logger.info("Application started with administrator privileges")
@@ -816,10 +953,16 @@ if __name__ == "__main__":
         print("Creating QApplication...")
         app = QApplication(sys.argv)
         app.setWindowIcon(QIcon("icon.ico"))
-        print("Creating main window...")
-        window = MemoryMonitorApp()
-        print("Showing main window...")
-        window.show()
+        
+        # Paint a splash screen before loading the application modules
+        splash_pixmap = QPixmap(360, 120)
+        splash_pixmap.fill(Qt.white)
+        splash = QSplashScreen(splash_pixmap)
+        splash.showMessage("Loading Memory & Cache Optimizer…", Qt.AlignCenter, Qt.black)
+        splash.show()
+        app.processEvents()
+        QTimer.singleShot(0, lambda: _finish_startup(app, splash))
+        
         print("Entering event loop...")
         sys.exit(app.exec_())
         